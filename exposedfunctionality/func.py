@@ -5,6 +5,13 @@ for exposing methods to the frontend.
 
 from __future__ import annotations
 from functools import wraps
+from types import (
+    FunctionType,
+    WrapperDescriptorType,
+    MethodDescriptorType,
+    ClassMethodDescriptorType,
+    GetSetDescriptorType,
+)
 from .function_parser import (
     function_method_parser,
     SerializedFunction,
@@ -148,14 +155,57 @@ def get_exposed_methods(obj: Any) -> Dict[str, Tuple[Callable, SerializedFunctio
         key is the method name and the value is a tuple of the method itself and its SerializedFunction data.
     """
 
-    methods = [
-        (func, getattr(obj, func)) for func in dir(obj) if callable(getattr(obj, func))
-    ]
-    return {
-        attr_name: (attr_value, attr_value.ef_funcmeta)
-        for attr_name, attr_value in methods
-        if is_exposed_method(attr_value)
-    }
+    # check the raw attributes first, so only exposed methods are bound and
+    # unrelated descriptors (e.g. properties) are never triggered
+    is_class = isinstance(obj, type)
+    namespaces = [] if is_class else [getattr(obj, "__dict__", {})]
+    namespaces.extend(vars(klass) for klass in (obj if is_class else type(obj)).__mro__)
+
+    candidate_names = set()
+    seen = set()
+    for namespace in namespaces:
+        for attr_name, raw_value in namespace.items():
+            if attr_name in seen:
+                continue
+            seen.add(attr_name)
+            # staticmethod and classmethod objects wrap the exposed function, other
+            # descriptors (e.g. slots) only tell what they return once they are bound
+            if (
+                is_exposed_method(raw_value)
+                or is_exposed_method(getattr(raw_value, "__func__", None))
+                or _may_bind_exposed_method(raw_value)
+            ):
+                candidate_names.add(attr_name)
+
+    if type(obj).__dir__ is not (type.__dir__ if is_class else object.__dir__):
+        # a custom __dir__ can report names that only __getattr__ resolves
+        candidate_names.update(name for name in dir(obj) if name not in seen)
+
+    methods = {}
+    for attr_name in sorted(candidate_names):
+        attr_value = getattr(obj, attr_name, None)
+        if is_exposed_method(attr_value):
+            methods[attr_name] = (attr_value, attr_value.ef_funcmeta)
+    return methods
+
+
+# descriptors whose binding is known not to return an exposed method
+_PLAIN_DESCRIPTOR_TYPES = (
+    FunctionType,
+    staticmethod,
+    classmethod,
+    property,
+    WrapperDescriptorType,
+    MethodDescriptorType,
+    ClassMethodDescriptorType,
+    GetSetDescriptorType,
+)
+
+
+def _may_bind_exposed_method(raw_value: Any) -> bool:
+    return hasattr(type(raw_value), "__get__") and not isinstance(
+        raw_value, _PLAIN_DESCRIPTOR_TYPES
+    )
 
 
 def is_exposed_method(
@@ -1,12 +1,15 @@
 from __future__ import annotations
 import re
 import warnings
+from copy import deepcopy
+from functools import lru_cache
 
-from typing import Callable
+from typing import Callable, Dict
 from .types import (
     string_to_type,
     type_to_string,
     cast_to_type,
+    _TYPE_ADDED_CALLBACKS,
 )
 
 from .ser_types import (
@@ -16,6 +19,42 @@ from .ser_types import (
     TypeNotFoundError,
 )
 
+# precompiled patterns used by the parsers below
+_DEFAULTS_RE = re.compile(r"[Dd]efaults to (`[^`]+`|'[^']+'|\"[^\"]+\"|[^\s.,]+)")
+_DESC_SPACES_RE = re.compile(r" +([.,:])| {2,}")
+
+_RST_TAG_RE = re.compile(r":(\w+)")
+# "name: text" in param and raises sections
+_RST_NAMED_TEXT_RE = re.compile(r"([\w_]+):(.+)")
+_RST_PARAM_NAME_RE = re.compile(r"([\w_]+)")
+
+_GOOGLE_SECTIONS = frozenset(("Args", "Returns", "Raises"))
+# "name (type): description", "name (type)", "name: description" or "name:"
+_GOOGLE_ARG_RE = re.compile(
+    r"^(?P<name>\w+)(?: \((?P<type>[\w\[\], ]+)\)(?:: (?P<type_desc>.+))?"
+    r"|: (?P<desc>.+)|:)$"
+)
+_GOOGLE_RETURN_RE = re.compile(r"([\w\[\], ]+): (.+)")
+_GOOGLE_RAISE_RE = re.compile(r"(\w+):(.+)")
+
+_NUMPY_SECTION_RE = re.compile(r"^\n\s*([^\n]*)\s*\n\s*[-]+\s*\n", re.MULTILINE)
+_NUMPY_PARAM_RE = re.compile(r"\s*([\w,\s\*\`\"\']+)\s*:\s*(.+)")
+_NUMPY_RETURN_RE = re.compile(r"\s*([\w,\s\-\_]+)\s*:\s*(.+)")
+
+# reStructuredText docstrings use field tags like :param, :raises and :return
+_RST_STYLE_RE = re.compile(r":(?:param|raises|return)")
+# NumPy docstrings have sections like Parameters, Returns, and Examples followed by a newline and dashes
+_NUMPY_STYLE_RE = re.compile(
+    r"^\s*(?:Parameters|Returns|Examples)\s*\n\s*[-]+\s*\n", re.MULTILINE
+)
+# match "param_name (param_type):" or "param_name:"
+_GOOGLE_STYLE_RE = re.compile(r"^\s*([a-zA-Z_]\w*)(?:\s?\(.*\))?:", re.MULTILINE)
+
+
+def _clean_desc_spaces(match: re.Match) -> str:
+    # spaces before punctuation are removed, other runs become a single space
+    return match.group(1) or " "
+
 
 def _unify_parser_results(
     result: DocstringParserResult, docstring=str
@@ -36,6 +75,10 @@ def _unify_parser_results(
         if not result["summary"]:
             del result["summary"]
 
+    # nothing left to unify, e.g. for docstrings without a recognized style
+    if not (result["input_params"] or result["output_params"] or result["exceptions"]):
+        return result
+
     # strip and remove empty descriptions
     for param in result["input_params"]:
         if "description" not in param:
@@ -44,9 +87,9 @@ def _unify_parser_results(
         if param["description"]:
             param["description"] = param["description"].strip()
 
-            if "defaults to" in param["description"].lower():
-                pattern = r"[Dd]efaults to (`[^`]+`|'[^']+'|\"[^\"]+\"|[^\s.,]+)"
-                match = re.search(pattern, param["description"])
+            # cheap substring gate before running the regex, matching its [Dd] prefix
+            if "efaults to" in param["description"]:
+                match = _DEFAULTS_RE.search(param["description"])
                 if match:
                     description = param["description"]
                     description = (
@@ -58,31 +101,36 @@ def _unify_parser_results(
 
                     param["description"] = description.strip(" ,.")
         if "default" in param and isinstance(param["default"], str):
-            if param["default"].startswith(("`", "'", '"')):
-                param["default"] = param["default"][1:-1]
-        if "default" in param and "type" in param:
-            try:
-                param["default"] = cast_to_type(
-                    param["default"], string_to_type(param["type"])
-                )
-            except (ValueError, TypeNotFoundError):
-                pass
+            default = param["default"]
+            # strip all quote layers, e.g. of rst literals like ``value``
+            while (
+                len(default) > 1 and default[0] in "`'\"" and default[-1] == default[0]
+            ):
+                default = default[1:-1]
+            param["default"] = default
         if "type" in param:
-            param["type"] = type_to_string(param["type"])
+            ptype = param["type"]
+            if "default" in param:
+                try:
+                    param["default"] = cast_to_type(
+                        param["default"], string_to_type(ptype)
+                    )
+                except (ValueError, TypeNotFoundError):
+                    pass
+            param["type"] = type_to_string(ptype)
 
         if param["description"]:
-            param["description"] = (
-                param["description"]
-                .replace("  ", " ")
-                .replace(" .", ".")
-                .replace(" ,", ",")
-                .replace(" :", ":")
-                .replace(",.", ".")
+            # collapse multiple spaces and drop spaces in front of punctuation
+            param["description"] = _DESC_SPACES_RE.sub(
+                _clean_desc_spaces, param["description"]
             ).strip()
             # add dot if missing
 
         if param["description"] and not param["description"].endswith("."):
             param["description"] += "."
+        if param["description"]:
+            # after the dot is added, so descriptions ending with a comma are covered
+            param["description"] = param["description"].replace(",.", ".")
 
         if "positional" not in param:
             if "default" in param or ("optional" in param and param["optional"]):
@@ -99,20 +147,15 @@ def _unify_parser_results(
         if not param["description"]:
             del param["description"]
 
-    for i, param in enumerate(result["output_params"]):
-        if "name" not in param:
-            param["name"] = f"out{i}" if len(result["output_params"]) > 1 else "out"
-
-        if "type" in param:
-            param["type"] = type_to_string(param["type"])
+    # name, type and strip and remove empty return
+    n_outs = len(result["output_params"])
+    for i, op in enumerate(result["output_params"]):
+        if "name" not in op:
+            op["name"] = f"out{i}" if n_outs > 1 else "out"
 
-    # strip and remove empty errors
+        if "type" in op:
+            op["type"] = type_to_string(op["type"])
 
-    for error in list(result["exceptions"].keys()):
-        result["exceptions"][error] = result["exceptions"][error].strip()
-
-    # strip  and remove empty return
-    for op in result["output_params"]:
         if "description" not in op:
             op["description"] = None
 
@@ -121,13 +164,149 @@ def _unify_parser_results(
         if not op["description"]:
             del op["description"]
 
-    # strip summary
-    if "summary" in result:
-        result["summary"] = result["summary"].strip()
+    # strip and remove empty errors
+
+    for error in list(result["exceptions"].keys()):
+        result["exceptions"][error] = result["exceptions"][error].strip()
 
     return result
 
 
+def _append_fragment(target: dict, key: str, fragment: str):
+    # multi-line texts are collected as lists and joined once parsing is done
+    parts = target.get(key)
+    if not isinstance(parts, list):
+        parts = target[key] = [parts] if parts is not None else []
+    parts.append(fragment)
+
+
+def _join_fragments(target: dict, key: str):
+    if isinstance(target.get(key), list):
+        target[key] = " ".join(target[key])
+
+
+def _rst_summary_section(section: str, result: DocstringParserResult):
+    if not section.startswith(":summary:"):
+        return
+    s = section.replace(":summary:", "").strip()
+    if s:
+        result["summary"] = s
+
+
+def _rst_param_section(section: str, result: DocstringParserResult):
+    psection = section.replace(":param", "").strip()
+    param_match = _RST_NAMED_TEXT_RE.match(psection)
+    if not param_match:
+        # maybe only a name is given
+        param_match = _RST_PARAM_NAME_RE.match(psection)
+
+        if not param_match:
+            raise ValueError(f"Could not parse line '{section}' as parameter")
+    param = {"name": param_match.group(1)}
+
+    if len(param_match.groups()) > 1:
+        # if param_match.group(2): not necessary since by stripping it cannot be an empty string
+        param["description"] = param_match.group(2).strip()
+    else:
+        param["description"] = None
+    # default optional
+    param["optional"] = False
+
+    result["input_params"].append(param)
+
+
+def _rst_type_section(section: str, result: DocstringParserResult):
+    if len(result["input_params"]) == 0:
+        raise ValueError("Type section without parameter")
+    psection = section.replace(":type", "").strip()
+
+    # get param name or last param
+    param = None
+    if ":" in psection:
+        param_name, psection = psection.split(":", 1)
+        param_name = param_name.strip()
+        if not param_name:
+            # there is always one available otherwise it would have failes ~10 lines before:
+            param_name = result["input_params"][-1]["name"]
+
+        for _param in result["input_params"]:
+            if _param["name"] == param_name:
+                param = _param
+                break
+    else:
+        param = result["input_params"][-1]
+    if param is None:
+        raise ValueError(f"Could not find parameter for type section '{section}'")
+
+    _type = psection.strip()
+    if "optional" in _type:
+        param["optional"] = True
+        _types = [t.strip() for t in _type.replace("optional", "").split(",")]
+        _types = [t for t in _types if t]
+        if len(_types) >= 1:
+            _type = _types[0]
+        else:
+            _type = None
+    else:
+        param["optional"] = False
+    if _type:
+        try:
+            param["type"] = string_to_type(_type)
+        except Exception:
+            pass
+
+
+def _rst_raises_section(section: str, result: DocstringParserResult):
+    rsection = section.replace(":raises", "").strip()
+    if ":" in rsection:
+        rsection += " "
+        raise_match = _RST_NAMED_TEXT_RE.match(rsection)
+        if not raise_match:
+            raise ValueError(f"Could not parse line '{section}' as raise")
+        result["exceptions"][raise_match.group(1)] = raise_match.group(2).strip()
+    else:
+        _excep = rsection.split()
+        if len(_excep) != 1:
+            raise ValueError(f"Could not parse line '{section}' as raise")
+        result["exceptions"][_excep[0]] = ""
+
+
+def _rst_return_section(section: str, result: DocstringParserResult):
+    rsection = section.replace(":return:", "").strip()
+    return_desc = {"description": rsection}
+    result["output_params"].append(return_desc)
+
+
+def _rst_rtype_section(section: str, result: DocstringParserResult):
+    if len(result["output_params"]) == 0:
+        raise ValueError("Type section without return")
+    rsection = section.replace(":rtype:", "").strip()
+    try:
+        result["output_params"][0]["type"] = string_to_type(rsection)
+    except Exception:
+        pass
+
+
+# section tag (the word after the leading colon) to section handler
+_RST_SECTION_HANDLERS: Dict[str, Callable[[str, DocstringParserResult], None]] = {
+    "summary": _rst_summary_section,
+    "param": _rst_param_section,
+    "type": _rst_type_section,
+    "raises": _rst_raises_section,
+    "return": _rst_return_section,
+    "returns": _rst_return_section,
+    "rtype": _rst_rtype_section,
+}
+# tags that only start with a section tag (e.g. ":types") are matched by prefix, in this order
+_RST_SECTION_PREFIXES = (
+    ("param", _rst_param_section),
+    ("type", _rst_type_section),
+    ("raises", _rst_raises_section),
+    ("return", _rst_return_section),
+    ("rtype", _rst_rtype_section),
+)
+
+
 def parse_restructured_docstring(docstring: str) -> DocstringParserResult:
     """Extracts the parameter descriptions from a reStructuredText docstring.
 
@@ -166,21 +345,20 @@ def parse_restructured_docstring(docstring: str) -> DocstringParserResult:
     # prepend :summary: to the docstring
     original_ = docstring
     docstring = ":summary:\n" + docstring
-    lines = docstring.strip().split("\n")
-    lines = [line.strip() for line in lines if line.strip()]
-
+    # join the stripped, non-empty lines of each section in one pass
     sections = []
     current_section = []
-    for line in lines:
-        if line.startswith(":") and current_section:
-            sections.append(current_section)
-            current_section = []
+    for line in docstring.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == ":" and current_section:
+            sections.append(" ".join(current_section))
+            current_section.clear()
         current_section.append(line)
 
     # even empty docstring would have :summary:
-    sections.append(current_section)
-
-    sections = [" ".join(section) for section in sections]
+    sections.append(" ".join(current_section))
 
     result: DocstringParserResult = {
         "input_params": [],
@@ -189,99 +367,18 @@ def parse_restructured_docstring(docstring: str) -> DocstringParserResult:
     }
 
     for section in sections:
-        if section.startswith(":summary:"):
-            s = section.replace(":summary:", "").strip()
-            if s:
-                result["summary"] = s
-        elif section.startswith(":param"):
-            psection = section.replace(":param", "").strip()
-            param_match = re.match(r"([\w_]+):(.+)", psection)
-            if not param_match:
-                # maybe only a name is given
-                param_match = re.match(r"([\w_]+)", psection)
-
-                if not param_match:
-                    raise ValueError(f"Could not parse line '{section}' as parameter")
-            param = {"name": param_match.group(1)}
-
-            if len(param_match.groups()) > 1:
-                # if param_match.group(2): not necessary since by stripping it cannot be an empty string
-                param["description"] = param_match.group(2).strip()
-            else:
-                param["description"] = None
-            # default optional
-            param["optional"] = False
-
-            result["input_params"].append(param)
-        elif section.startswith(":type"):
-            if len(result["input_params"]) == 0:
-                raise ValueError("Type section without parameter")
-            psection = section.replace(":type", "").strip()
-
-            # get param name or last param
-            param = None
-            if ":" in psection:
-                param_name, psection = psection.split(":", 1)
-                param_name = param_name.strip()
-                if not param_name:
-                    # there is always one available otherwise it would have failes ~10 lines before:
-                    param_name = result["input_params"][-1]["name"]
-
-                for _param in result["input_params"]:
-                    if _param["name"] == param_name:
-                        param = _param
-                        break
-            else:
-                param = result["input_params"][-1]
-            if param is None:
-                raise ValueError(
-                    f"Could not find parameter for type section '{section}'"
-                )
-
-            _type = psection.strip()
-            if "optional" in _type:
-                param["optional"] = True
-                _types = [t.strip() for t in _type.replace("optional", "").split(",")]
-                _types = [t for t in _types if t]
-                if len(_types) >= 1:
-                    _type = _types[0]
-                else:
-                    _type = None
-            else:
-                param["optional"] = False
-            if _type:
-                try:
-                    param["type"] = string_to_type(_type)
-                except Exception:
-                    pass
-
-        elif section.startswith(":raises"):
-            rsection = section.replace(":raises", "").strip()
-            if ":" in rsection:
-                rsection += " "
-                raise_match = re.match(r"([\w_]+):(.+)", rsection)
-                if not raise_match:
-                    raise ValueError(f"Could not parse line '{section}' as raise")
-                result["exceptions"][raise_match.group(1)] = raise_match.group(
-                    2
-                ).strip()
-            else:
-                _excep = rsection.split()
-                if len(_excep) != 1:
-                    raise ValueError(f"Could not parse line '{section}' as raise")
-                result["exceptions"][_excep[0]] = ""
-        elif section.startswith(":return"):
-            rsection = section.replace(":return:", "").strip()
-            return_desc = {"description": rsection}
-            result["output_params"].append(return_desc)
-        elif section.startswith(":rtype"):
-            if len(result["output_params"]) == 0:
-                raise ValueError("Type section without return")
-            rsection = section.replace(":rtype:", "").strip()
-            try:
-                result["output_params"][0]["type"] = string_to_type(rsection)
-            except Exception:
-                pass
+        tag_match = _RST_TAG_RE.match(section)
+        if not tag_match:
+            continue
+        tag = tag_match.group(1)
+        handler = _RST_SECTION_HANDLERS.get(tag)
+        if handler is None:
+            handler = next(
+                (h for prefix, h in _RST_SECTION_PREFIXES if tag.startswith(prefix)),
+                None,
+            )
+        if handler is not None:
+            handler(section, result)
 
     return _unify_parser_results(result, docstring=original_)
 
@@ -324,7 +421,7 @@ def parse_google_docstring(docstring: str) -> DocstringParserResult:
     """
 
     # Split the docstring by lines
-    pre_strip_lines = [line for line in docstring.split("\n") if line.strip()]
+    pre_strip_lines = [line for line in docstring.splitlines() if line.strip()]
 
     lines = [line.strip() for line in pre_strip_lines]
 
@@ -352,62 +449,36 @@ def parse_google_docstring(docstring: str) -> DocstringParserResult:
     last_param: dict = {}  # to append multi-line descriptions
     last_exception = None
     for li, line in enumerate(lines):
-        if line.startswith("Args:"):
-            section = "Args"
-        elif line.startswith("Returns:"):
-            section = "Returns"
-        elif line.startswith("Raises:"):
-            section = "Raises"
+        head, colon, _ = line.partition(":")
+        if colon and head in _GOOGLE_SECTIONS:
+            section = head
         elif (
-            ":" in line
-            and line.split(":")[0].rstrip()
+            colon
+            and head.rstrip()
             == pre_strip_lines[li].split(":")[0].rstrip()[section_intentation:]
-            and len(line.split(":")[0].rstrip().split()) == 1
+            and len(head.rstrip().split()) == 1
         ):
             # unknown section
-            section = line.split(":")[0].rstrip()
+            section = head.rstrip()
 
             warnings.warn(f"Encounterd unknown section: {section}")
 
         else:
             if section == "Sum":
-                if "summary" in result:
-                    result["summary"] += " " + line
-                else:
-                    result["summary"] = line
+                _append_fragment(result, "summary", line)
             if section == "Args":
-                param_match_full = re.match(r"^(\w+) \(([\w\[\], ]+)\): (.+)$", line)
-                param_match_desc = re.match(r"^(\w+): (.+)$", line)
-                param_match_type = re.match(r"^(\w+) \(([\w\[\], ]+)\)$", line)
-                param_match_name_only = re.match(r"^(\w+):$", line)
-
-                if param_match_full:
-                    param_match = param_match_full
-                    name = param_match.group(1)
-                    type_opt = param_match.group(2)
-                    description = param_match.group(3)
-                elif param_match_type:
-                    param_match = param_match_type
-                    name = param_match.group(1)
-                    type_opt = param_match.group(2)
-                    description = ""
-                elif param_match_desc:
-                    param_match = param_match_desc
-                    name = param_match.group(1)
-                    type_opt = None
-                    description = param_match.group(2)
-                elif param_match_name_only:
-                    param_match = param_match_name_only
-                    name = param_match.group(1)
-                    type_opt = None
-                    description = None
-
+                arg_match = _GOOGLE_ARG_RE.match(line)
+                if arg_match:
+                    name = arg_match.group("name")
+                    type_opt = arg_match.group("type")
+                    if type_opt is not None:
+                        # "name (type): description" or just "name (type)"
+                        description = arg_match.group("type_desc") or ""
+                    else:
+                        # "name: description" or just "name:"
+                        description = arg_match.group("desc")
                 else:
-                    last_param["description"] = (
-                        last_param["description"] + " " + line
-                        if "description" in last_param
-                        else line
-                    )
+                    _append_fragment(last_param, "description", line)
                     continue
 
                 optional = False
@@ -435,7 +506,7 @@ def parse_google_docstring(docstring: str) -> DocstringParserResult:
                 result["input_params"].append(param)
                 last_param = param
             elif section == "Returns":
-                return_match = re.match(r"([\w\[\], ]+): (.+)", line)
+                return_match = _GOOGLE_RETURN_RE.match(line)
                 if return_match:
                     return_param = {
                         "description": return_match.group(2),
@@ -448,13 +519,9 @@ def parse_google_docstring(docstring: str) -> DocstringParserResult:
                     result["output_params"].append(return_param)
                     last_param = return_param
                 elif last_param:
-                    last_param["description"] = (
-                        last_param["description"] + " " + line
-                        if "description" in last_param
-                        else line
-                    )
+                    _append_fragment(last_param, "description", line)
             elif section == "Raises":
-                raise_match = re.match(r"(\w+):(.+)", line + " ")
+                raise_match = _GOOGLE_RAISE_RE.match(line + " ")
                 if raise_match:
                     last_exception = raise_match.group(1)
                     result["exceptions"][last_exception] = (
@@ -462,7 +529,13 @@ def parse_google_docstring(docstring: str) -> DocstringParserResult:
                     ).strip()
 
                 elif last_exception:
-                    result["exceptions"][last_exception] += " " + line
+                    _append_fragment(result["exceptions"], last_exception, line)
+
+    _join_fragments(result, "summary")
+    for param in result["input_params"] + result["output_params"]:
+        _join_fragments(param, "description")
+    for exception in result["exceptions"]:
+        _join_fragments(result["exceptions"], exception)
 
     return _unify_parser_results(result, docstring)
 
@@ -472,12 +545,10 @@ def parse_numpy_docstring(docstring: str) -> DocstringParserResult:
     res = DocstringParserResult(
         summary="",
     )
-    # Regular expressions to identify sections
-    section_regex = re.compile(r"^\n\s*([^\n]*)\s*\n\s*[-]+\s*\n", re.MULTILINE)
-
     # Find all section starts
     section_starts = [
-        (match.start(), match.group(1)) for match in section_regex.finditer(docstring)
+        (match.start(), match.group(1))
+        for match in _NUMPY_SECTION_RE.finditer(docstring)
     ]
     if len(section_starts) > 0:
         first_section_start = min(section_starts, key=lambda x: x[0])
@@ -506,7 +577,7 @@ def parse_numpy_docstring(docstring: str) -> DocstringParserResult:
         current_param_intendation = 0
         current_intendation = 0
         for line in sections["Parameters"].split("\n"):
-            param_match = re.match(r"\s*([\w,\s\*\`\"\']+)\s*:\s*(.+)", line)
+            param_match = _NUMPY_PARAM_RE.match(line)
             if (
                 param_match
                 and param_match.group(1).strip()
@@ -558,7 +629,7 @@ def parse_numpy_docstring(docstring: str) -> DocstringParserResult:
         current_param = None
         current_intendation = 0
         for line in sections["Returns"].split("\n"):
-            param_match = re.match(r"\s*([\w,\s\-\_]+)\s*:\s*(.+)", line)
+            param_match = _NUMPY_RETURN_RE.match(line)
             if (
                 param_match
                 and param_match.group(1).strip()
@@ -622,41 +693,40 @@ def select_extraction_function(docstring: str) -> Callable:
         Callable: The selected extraction function.
     """
     # Check for reStructuredText indicators
-    if ":param" in docstring or ":raises" in docstring or ":return" in docstring:
+    if _RST_STYLE_RE.search(docstring):
         return parse_restructured_docstring
 
     # Check for NumPy style indicators
-    # NumPy docstrings have sections like Parameters, Returns, and Examples followed by a newline and dashes
-    numpy_section_patterns = [
-        r"^\s*Parameters\s*\n\s*[-]+\s*\n",
-        r"^\s*Returns\s*\n\s*[-]+\s*\n",
-        r"^\s*Examples\s*\n\s*[-]+\s*\n",
-    ]
-    if any(
-        re.search(pattern, docstring, re.MULTILINE)
-        for pattern in numpy_section_patterns
-    ):
+    if _NUMPY_STYLE_RE.search(docstring):
         return parse_numpy_docstring
 
     # Check for Google style indicators
     # (Note: Google style is more general and may overlap with other styles,
     # so we check it last)
-    param_pattern_google_with_types = (
-        r"^\s*([a-zA-Z_]\w*)\s?\(.*\):"  # match "param_name (param_type):"
-    )
-    param_pattern_google_no_types = r"^\s*([a-zA-Z_]\w*):"  # match "param_name:"
-    if re.search(param_pattern_google_with_types, docstring, re.MULTILINE):
-        return parse_google_docstring
-    if re.search(param_pattern_google_no_types, docstring, re.MULTILINE):
+    if _GOOGLE_STYLE_RE.search(docstring):
         return parse_google_docstring
 
     # If none match, return None or you could return a default function
     return None
 
 
+@lru_cache(maxsize=1024)
+def _parse_docstring_cached(docstring: str) -> DocstringParserResult:
+    extraction_function = select_extraction_function(docstring)
+    if extraction_function is None:
+        return _unify_parser_results({"summary": docstring}, docstring=docstring)
+    # the extraction functions already return unified results
+    return extraction_function(docstring)
+
+
+# the parsed types depend on the type registry
+_TYPE_ADDED_CALLBACKS.append(_parse_docstring_cached.cache_clear)
+
+
 def parse_docstring(docstring: str) -> DocstringParserResult:
     """
     Extracts the parameter descriptions from a docstring.
+    Results are cached per docstring, each call returns an independent copy.
 
     Args:
         docstring (str): The docstring from which the parameter descriptions are extracted.
@@ -664,7 +734,4 @@ def parse_docstring(docstring: str) -> DocstringParserResult:
     Returns:
         dict: A dictionary of parameter names to their descriptions.
     """
-    extraction_function = select_extraction_function(docstring)
-    if extraction_function is None:
-        return _unify_parser_results({"summary": docstring}, docstring=docstring)
-    return _unify_parser_results(extraction_function(docstring), docstring=docstring)
+    return deepcopy(_parse_docstring_cached(docstring))
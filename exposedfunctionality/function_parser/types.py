@@ -2,6 +2,7 @@ from __future__ import annotations
 from enum import Enum
 import importlib
 import re
+import sys
 import ast
 from typing import (
     Union,
@@ -14,6 +15,7 @@ from typing import (
     List,
     Literal,
     Sequence,
+    Callable,
     get_origin,
     get_args,
 )
@@ -60,8 +62,28 @@ ALLOWED_BUILTINS = {
 }
 
 
+# marks missing attributes, since None can be a valid attribute value
+_MISSING = object()
+
+# main type and content of parameterized types like List[int]
+_PARAM_TYPE_RE = re.compile(r"(\w+)\[(.*)\]\Z")
+# "optional" markers in type strings like "int, optional"
+_OPTIONAL_RE = re.compile("optional", re.IGNORECASE)
+
 _TYPE_GETTER: Dict[str, type] = {}
 _STRING_GETTER: Dict[type, str] = {}
+# called whenever add_type makes a new name or type known, so caches depending on the registry can be cleared
+_TYPE_ADDED_CALLBACKS: List[Callable[[], None]] = []
+# type_to_string results of typing generics, which are formatted recursively otherwise
+_TYPING_STRINGS: Dict[Any, str] = {}
+_TYPE_ADDED_CALLBACKS.append(_TYPING_STRINGS.clear)
+
+
+def _register_type(type_: type, name: str):
+    # remembers names that string_to_type and type_to_string resolved themselves,
+    # these resolve to the same result anyway, so no cache has to be cleared
+    _STRING_GETTER.setdefault(type_, name)
+    return _TYPE_GETTER.setdefault(name, type_)
 
 
 def add_type(type_: type, name: str):
@@ -72,16 +94,15 @@ def add_type(type_: type, name: str):
     - type_: The type to add.
     - name: The name of the type.
 
-    Raises:
-    - ValueError if the type is already in the list.
+    Returns:
+    - The type registered for the name, existing entries are never overridden.
     """
-    if name not in _TYPE_GETTER:
-        _TYPE_GETTER[name] = type_
-
-    if type_ not in _STRING_GETTER:
-        _STRING_GETTER[type_] = name
-
-    return _TYPE_GETTER[name]
+    changed = type_ not in _STRING_GETTER or name not in _TYPE_GETTER
+    registered = _register_type(type_, name)
+    if changed:
+        for callback in _TYPE_ADDED_CALLBACKS:
+            callback()
+    return registered
 
 
 for k, v in ALLOWED_BUILTINS.items():
@@ -97,29 +118,78 @@ for k, v in {
     add_type(v, k)
 
 
+def _import_module(name: str):
+    # already imported modules are taken from sys.modules without the import machinery
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+
 def split_type_string(string: str):
     """splits a comma seperated type string into its parts, while reserving nested types
     e.g. "int, str" -> ["int", "str"]
     e.g. "List[int], str" -> ["List[int]", "str"]
     eg. "int, union[str, int]" -> ["int", "Union[str, int]"]
     """
+    if "[" not in string:
+        return string.split(",")
+
+    # slice at the top level commas instead of building the parts char by char
     parts = []
     level = 0
-    current = ""
-    for c in string:
-        if c == "," and level == 0:
-            parts.append(current)
-            current = ""
-        else:
-            if c == "[":
-                level += 1
-            elif c == "]":
-                level -= 1
-            current += c
-    parts.append(current)
+    start = 0
+    for i, c in enumerate(string):
+        if c == "[":
+            level += 1
+        elif c == "]":
+            level -= 1
+        elif c == "," and level == 0:
+            parts.append(string[start:i])
+            start = i + 1
+    parts.append(string[start:])
     return parts
 
 
+def _dict_param_type(content: str):
+    key, value = map(str.strip, split_type_string(content))
+    return Dict[string_to_type(key), string_to_type(value)]
+
+
+def _tuple_param_type(content: str):
+    items = tuple(map(string_to_type, split_type_string(content)))
+    return Tuple[items]
+
+
+def _union_param_type(content: str):
+    subtypes = tuple(map(string_to_type, split_type_string(content)))
+    if len(subtypes) >= 2:
+        return Union[subtypes]  # type: ignore # mypy doesn't like the splat operator
+    else:
+        return subtypes[0]
+
+
+def _literal_param_type(content: str):
+    items = [item.strip() for item in split_type_string(content)]
+    items = [item for item in items if item]
+    items = tuple([ast.literal_eval(item.strip()) for item in items])
+    return Literal[items]  # type: ignore # mypy doesn't like the splat operator
+
+
+# handlers for the content of parameterized types, by main type
+_PARAM_TYPE_HANDLERS: Dict[str, Callable[[str], Any]] = {
+    "List": lambda content: List[string_to_type(content)],
+    "Sequence": lambda content: Sequence[string_to_type(content)],
+    "Dict": _dict_param_type,
+    "Tuple": _tuple_param_type,
+    "Union": _union_param_type,
+    "Optional": lambda content: Optional[string_to_type(content)],
+    "Type": lambda content: Type[string_to_type(content)],
+    "Set": lambda content: Set[string_to_type(content)],
+    "Literal": _literal_param_type,
+}
+
+
 def string_to_type(
     string: str,
 ) -> type:
@@ -137,91 +207,58 @@ def string_to_type(
     - ImportError if there's a problem importing the module.
     """
 
-    if isinstance(string, type) or (
-        hasattr(string, "__origin__") and not isinstance(string, str)
-    ):
+    if isinstance(string, str):
+        # registered strings need neither normalization nor parsing
+        if string in _TYPE_GETTER:
+            return _TYPE_GETTER[string]
+    elif isinstance(string, type) or hasattr(string, "__origin__"):
         return string
-
-    if not isinstance(string, str):
+    else:
         raise TypeError(f"Expected str, got {type(string)}")
 
     string = string.strip().strip(".,").strip()
 
-    # Helper function to handle parameterized types
-
-    def handle_param_type(main_type: str, content: str):
-        if main_type == "List":
-            return List[string_to_type(content)]
-        elif main_type == "Sequence":
-            return Sequence[string_to_type(content)]
-        elif main_type == "Dict":
-            key, value = map(str.strip, split_type_string(content))
-            return Dict[string_to_type(key), string_to_type(value)]
-        elif main_type == "Tuple":
-            items = tuple(map(string_to_type, split_type_string(content)))
-            return Tuple[items]
-        elif main_type == "Union":
-            subtypes = tuple(map(string_to_type, split_type_string(content)))
-            if len(subtypes) >= 2:
-                return Union[subtypes]  # type: ignore # mypy doesn't like the splat operator
-            else:
-                return subtypes[0]
-        elif main_type == "Optional":
-            return Optional[string_to_type(content)]
-        elif main_type == "Type":
-            return Type[string_to_type(content)]
-        elif main_type == "Set":
-            return Set[string_to_type(content)]
-        elif main_type == "Literal":
-            items = [item.strip() for item in split_type_string(content)]
-            items = [item for item in items if item]
-            items = tuple([ast.literal_eval(item.strip()) for item in items])
-            return Literal[items]  # type: ignore # mypy doesn't like the splat operator
-        else:
-            raise TypeNotFoundError(string)
+    # builtins, added types and all previously resolved type strings are registered,
+    # so repeated lookups skip the parsing and importing below
+    if string in _TYPE_GETTER:
+        return _TYPE_GETTER[string]
 
     # Check if the string is a parameterized type (like List[int] or Dict[str, int])
-    match = re.match(r"(\w+)\[(.*)\]$", string)
+    match = _PARAM_TYPE_RE.match(string) if "[" in string else None
     if match:
         main_type, content = match.groups()
-        _type = handle_param_type(main_type, content)
-        backstring = type_to_string(_type)
-        try:
-            add_type(
-                _type, backstring
-            )  # since the backstring should be prioritized add it first
-        except ValueError:
-            pass
-        try:
-            add_type(_type, string)
-        except ValueError:
-            pass
+        handler = _PARAM_TYPE_HANDLERS.get(main_type)
+        if handler is None:
+            raise TypeNotFoundError(string)
+        _type = handler(content)
+        if _type not in _STRING_GETTER:
+            # since the backstring should be prioritized add it first
+            _register_type(_type, type_to_string(_type))
+        _register_type(_type, string)
         return _type
 
     exc = None
-    if "." in string:
-        # Split the module path from the class name
-        module_name, class_name = string.rsplit(".", 1)
+    # Split the module path from the class name
+    module_name, dot, class_name = string.rpartition(".")
+    if dot:
 
         try:
-            module = importlib.import_module(module_name)
-            if hasattr(module, class_name):
-                cls = getattr(module, class_name)
-                try:
-                    add_type(cls, string)
-                except ValueError:
-                    pass
+            module = _import_module(module_name)
+            cls = getattr(module, class_name, _MISSING)
+            if cls is not _MISSING:
+                _register_type(cls, string)
                 return cls
         except ImportError as _exc:
             exc = _exc
 
-    if string in _TYPE_GETTER:
-        return _TYPE_GETTER[string]
-
-    if "optional" in string.lower():
-        string = string.replace("optional", "")
-        string = string.replace("Optional", "")
-        return Optional[string_to_type(string.strip())]
+    inner, n_optional = _OPTIONAL_RE.subn("", string)
+    if n_optional:
+        _type = Optional[string_to_type(inner.strip())]
+        # register like parameterized types, so the canonical name keeps priority
+        if _type not in _STRING_GETTER:
+            _register_type(_type, type_to_string(_type))
+        _register_type(_type, string)
+        return _type
 
     if exc:
         raise TypeNotFoundError(string) from exc
@@ -229,6 +266,64 @@ def string_to_type(
         raise TypeNotFoundError(string)
 
 
+def _list_string(t) -> str:
+    return f"List[{type_to_string(t.__args__[0])}]"
+
+
+def _sequence_string(t) -> str:
+    return f"Sequence[{type_to_string(t.__args__[0])}]"
+
+
+def _dict_string(t) -> str:
+    key_type = type_to_string(t.__args__[0])
+    value_type = type_to_string(t.__args__[1])
+    return f"Dict[{key_type}, {value_type}]"
+
+
+def _tuple_string(t) -> str:
+    return f"Tuple[{', '.join([type_to_string(subtype) for subtype in t.__args__])}]"
+
+
+def _union_string(t) -> str:
+    return f"Union[{', '.join([type_to_string(subtype) for subtype in t.__args__])}]"
+
+
+def _type_string(t) -> Optional[str]:
+    args = getattr(t, "__args__", None)
+    if args is not None:
+        return f"Type[{type_to_string(args[0])}]"
+    # else: already handeld by the simple "Type" entry
+    return None
+
+
+def _set_string(t) -> str:
+    return f"Set[{type_to_string(t.__args__[0])}]"
+
+
+def _literal_string(t) -> str:
+    return f"Literal[{str(tuple(t.__args__))[1:-1]}]"
+
+
+# formatters for typing generics, by their __origin__
+# (Optional[T] is just Union[T, None] in disguise, so it is formatted as Union)
+_ORIGIN_FORMATTERS: Dict[Any, Callable[[Any], Optional[str]]] = {
+    list: _list_string,
+    List: _list_string,
+    Sequence: _sequence_string,
+    collections.abc.Sequence: _sequence_string,
+    dict: _dict_string,
+    Dict: _dict_string,
+    tuple: _tuple_string,
+    Tuple: _tuple_string,
+    Union: _union_string,
+    Type: _type_string,
+    type: _type_string,
+    set: _set_string,
+    Set: _set_string,
+    Literal: _literal_string,
+}
+
+
 def type_to_string(t: Union[type, str]):
     """
     Convert a class object to a string.
@@ -242,62 +337,33 @@ def type_to_string(t: Union[type, str]):
     if isinstance(t, str):
         return t
 
-    def get_by_typing(t):
-        origin = getattr(t, "__origin__", None)
-        if origin:  #
-            # Optional[T] ist just Tuple[T,None] in disguise
-            # if origin is Optional:
-            #    return f"Optional[{type_to_string(t.__args__[0])}]"
-            if origin in [list, List]:
-                return f"List[{type_to_string(t.__args__[0])}]"
-            if origin in [Sequence, collections.abc.Sequence]:
-                return f"Sequence[{type_to_string(t.__args__[0])}]"
-            elif origin in [dict, Dict]:
-                key_type = type_to_string(t.__args__[0])
-                value_type = type_to_string(t.__args__[1])
-                return f"Dict[{key_type}, {value_type}]"
-            elif origin in [tuple, Tuple]:
-                return f"Tuple[{', '.join([type_to_string(subtype) for subtype in t.__args__])}]"
-            elif origin is Union:
-                return f"Union[{', '.join([type_to_string(subtype) for subtype in t.__args__])}]"
-            elif origin in [Type, type]:
-                if hasattr(t, "__args__"):
-                    return f"Type[{type_to_string(t.__args__[0])}]"
-                # else: already handeld by the simple "Type" entry
-                #    return "Type"
-            elif origin in [set, Set]:
-                return f"Set[{type_to_string(t.__args__[0])}]"
-            elif origin is Literal:
-                return f"Literal[{str(tuple(t.__args__))[1:-1]}]"
-
-    #                return f"Literal[{', '.join(str(lit) for lit in t.__args__)}]"
-
-    ans = get_by_typing(t)
-    if ans is not None:
-        try:
-            add_type(t, ans)
-        except ValueError:
-            pass
-        return ans
+    origin = getattr(t, "__origin__", None)
+    formatter = _ORIGIN_FORMATTERS.get(origin) if origin else None
+    if formatter is not None:
+        ans = _TYPING_STRINGS.get(t)
+        if ans is not None:
+            return ans
+        ans = formatter(t)
+        if ans is not None:
+            _register_type(t, ans)
+            _TYPING_STRINGS[t] = ans
+            return ans
 
     if t in _STRING_GETTER:
         return _STRING_GETTER[t]
         # Handle common typing types
 
-    if hasattr(t, "__name__") and hasattr(t, "__module__"):
-        name = t.__name__
-        module = t.__module__
+    name = getattr(t, "__name__", None)
+    module = getattr(t, "__module__", None)
+    if name is not None and module is not None:
         # check if name can be imported from module
         try:
-            module_obj = importlib.import_module(module)
+            module_obj = _import_module(module)
             if hasattr(module_obj, name):
                 ans = f"{module}.{name}"
-                try:
-                    _t = add_type(t, ans)
-                    return type_to_string(_t)
-                except ValueError:
-                    pass
-                return ans
+                _t = _register_type(t, ans)
+                # the name might already be registered for another type
+                return ans if _t is t else type_to_string(_t)
         except ImportError:
             pass
 
@@ -305,6 +371,10 @@ def type_to_string(t: Union[type, str]):
 
 
 def cast_to_type(value: Any, type_):
+    # exact type match, nothing to cast (subclasses like bool for int still get cast)
+    if type(value) is type_:
+        return value
+
     try:
         return type_(value)
     except Exception:
@@ -329,14 +399,10 @@ def cast_to_type(value: Any, type_):
 
     ex.append(ValueError(f"Could not cast {value} to type {type_}"))
 
-    # raise all ex from each other
-    e = ex[-1]
-    for _e in reversed(ex[:-1]):
-        try:
-            raise e from _e
-        except Exception as ne:
-            e = ne
-    raise e
+    # raise all ex from each other, each one caused by the one before
+    for cause, e in zip(ex, ex[1:]):
+        e.__cause__ = cause
+    raise ex[-1]
 
 
 class AllOf(TypedDict):
@@ -375,6 +441,10 @@ SerializedType = Union[str, AllOf, AnyOf, ArrayOf, DictOf, EnumOf, TypeOf]
 
 
 def serialize_type(type_: type) -> SerializedType:
+    if type(type_) is type:
+        # plain classes are neither generics nor enums (those have their own metaclass)
+        return type_to_string(type_)
+
     origin = get_origin(type_)
     args = get_args(type_)
 
@@ -33,14 +33,14 @@ class ExposedValueData:
 
         self._on_change_callbacks.append(callback)
 
-    def __getattribute__(self, __name: str) -> Any:
+    def __getattr__(self, __name: str) -> Any:
+        # only called if the regular lookup failed, so plain attributes stay fast
         try:
-            return super().__getattribute__(__name)
-        except AttributeError as exc:
-            try:
-                return self._data[__name]
-            except KeyError:
-                raise exc  # pylint: disable=raise-missing-from
+            return self.__dict__["_data"][__name]
+        except KeyError:
+            raise AttributeError(  # pylint: disable=raise-missing-from
+                f"'{type(self).__name__}' object has no attribute '{__name}'"
+            )
 
     def call_on_change_callbacks(
         self,
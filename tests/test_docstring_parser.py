@@ -57,6 +57,13 @@ class DoctringExtractionTests:
 
         self.assertEqual(result, expected)
 
+    def test_crlf_line_endings(self):
+        docstring = self.BASIC_DOCSTRING.replace("\n", "\r\n")
+        result = self.get_parser()(docstring)
+        expected = self.get_parser()(self.BASIC_DOCSTRING)
+        expected["original"] = docstring
+        self.assertEqual(result, expected)
+
     def test_only_summary(self):
         result = self.get_parser()(self.JUST_SUMMARY)
         expected = {
@@ -470,6 +477,20 @@ class TestParseRestructuredDocstring(DoctringExtractionTests, unittest.TestCase)
         with self.assertRaises(ValueError):
             self.get_parser()(docstring)
 
+    def test_tags_extending_known_tags(self):
+        docstring = """
+        :types: int
+        """
+        with self.assertRaises(ValueError):
+            self.get_parser()(docstring)
+
+        docstring = """
+        :param a: aparam
+        :types a: int
+        """
+        with self.assertRaises(ValueError):
+            self.get_parser()(docstring)
+
 
 class TestParseGoogleStyledDocstring(DoctringExtractionTests, unittest.TestCase):
     BASIC_DOCSTRING = """
@@ -774,4 +795,105 @@ class TestUnifyParserResults(unittest.TestCase):
 
         self.assertEqual(unified_result, expected)
 
+    def test_rst_literal_default(self):
+        from exposedfunctionality.function_parser.docstring_parser import (
+            _unify_parser_results,
+        )
+
+        result = {
+            "input_params": [
+                {"name": "a", "description": "A string. Defaults to ``foo``."},
+                {"name": "b", "description": "A type.", "type": "str"},
+            ],
+        }
+        result["input_params"][1]["default"] = "`float`"
+        unified_result = _unify_parser_results(result, "")
+
+        self.assertEqual(unified_result["input_params"][0]["default"], "foo")
+        self.assertEqual(unified_result["input_params"][1]["default"], "float")
+
+    def test_description_ending_with_comma(self):
+        from exposedfunctionality.function_parser.docstring_parser import (
+            _unify_parser_results,
+        )
+
+        result = {
+            "input_params": [
+                {"name": "a", "description": "Offset relative to the main diagonal,"}
+            ],
+        }
+        unified_result = _unify_parser_results(result, "")
+
+        self.assertEqual(
+            unified_result["input_params"][0]["description"],
+            "Offset relative to the main diagonal.",
+        )
+
     # Add more tests as needed to cover other scenarios.
+
+
+class TestParseDocstringCache(unittest.TestCase):
+    def test_cached_results_are_independent(self):
+        from exposedfunctionality.function_parser import parse_docstring
+
+        docstring = TestParseGoogleStyledDocstring.BASIC_DOCSTRING
+        first = parse_docstring(docstring)
+        first["input_params"][0]["name"] = "changed"
+        first["exceptions"].clear()
+
+        second = parse_docstring(docstring)
+        self.assertEqual(second["input_params"][0]["name"], "a")
+        self.assertEqual(
+            second["exceptions"], {"ValueError": "When something is wrong."}
+        )
+
+    def test_resolving_new_types_keeps_cached_results(self):
+        from exposedfunctionality.function_parser import parse_docstring
+        from exposedfunctionality.function_parser.docstring_parser import (
+            _parse_docstring_cached,
+        )
+
+        docstring = TestParseGoogleStyledDocstring.BASIC_DOCSTRING
+        parse_docstring(docstring)
+
+        parsed = parse_docstring(
+            """Use a new generic.
+
+            Args:
+                a (Dict[str, Tuple[bytes, Set[complex]]]): A mapping.
+            """
+        )
+        self.assertEqual(
+            parsed["input_params"][0]["type"], "Dict[str, Tuple[bytes, Set[complex]]]"
+        )
+
+        hits = _parse_docstring_cached.cache_info().hits
+        parse_docstring(docstring)
+        self.assertEqual(_parse_docstring_cached.cache_info().hits, hits + 1)
+
+    def test_types_added_after_parsing_are_resolved(self):
+        from exposedfunctionality.function_parser import parse_docstring
+        from exposedfunctionality.function_parser.types import (
+            add_type,
+            _TYPE_GETTER,
+            _STRING_GETTER,
+        )
+
+        class Widget:
+            pass
+
+        docstring = """Make a widget.
+
+        Args:
+            w (Widget): A widget.
+        """
+        self.assertNotIn("type", parse_docstring(docstring)["input_params"][0])
+
+        add_type(Widget, "Widget")
+        try:
+            self.assertEqual(
+                parse_docstring(docstring)["input_params"][0]["type"], "Widget"
+            )
+        finally:
+            del _TYPE_GETTER["Widget"]
+            del _STRING_GETTER[Widget]
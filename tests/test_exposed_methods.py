@@ -53,6 +53,66 @@ class TestExposedMethodDecorator(unittest.TestCase):
 
         self.assertEqual(example_func.ef_funcmeta, expected)
 
+    def test_reexpose_does_not_leak_overrides(self):
+        """Test that overrides from an earlier exposure do not leak into a later one."""
+        from exposedfunctionality import expose_method
+
+        def example_func(param1: int) -> int:
+            return param1
+
+        expose_method(
+            example_func,
+            name="first",
+            inputs=[{"name": "param1", "description": "changed"}],
+        )
+        exposed = expose_method(example_func)
+
+        self.assertEqual(exposed.ef_funcmeta["name"], "example_func")
+        self.assertNotIn("description", exposed.ef_funcmeta["input_params"][0])
+
+    def test_reexpose_resolves_types_added_later(self):
+        """Test that re-exposing a function picks up types added after the first exposure."""
+        from exposedfunctionality import expose_method, add_type
+        from exposedfunctionality.function_parser.types import (
+            _TYPE_GETTER,
+            _STRING_GETTER,
+        )
+
+        class Widget:
+            pass
+
+        def example_func(widget):
+            """Use a widget.
+
+            Args:
+                widget (Widget): The widget.
+            """
+
+        expose_method(example_func)
+        add_type(Widget, "Widget")
+        try:
+            exposed = expose_method(example_func)
+            self.assertEqual(exposed.ef_funcmeta["input_params"][0]["type"], "Widget")
+        finally:
+            del _TYPE_GETTER["Widget"]
+            del _STRING_GETTER[Widget]
+
+    def test_reexpose_uses_the_current_docstring(self):
+        """Test that re-exposing a function reflects changes to its docstring."""
+        from exposedfunctionality import expose_method
+
+        def example_func(param1: int) -> int:
+            """Old summary."""
+            return param1
+
+        expose_method(example_func)
+        example_func.__doc__ = "New summary."
+        example_func.__annotations__["param1"] = str
+        exposed = expose_method(example_func)
+
+        self.assertEqual(exposed.ef_funcmeta["docstring"]["summary"], "New summary.")
+        self.assertEqual(exposed.ef_funcmeta["input_params"][0]["type"], "str")
+
 
 class TestGetExposedMethods(unittest.TestCase):
     """
@@ -75,6 +135,121 @@ class TestGetExposedMethods(unittest.TestCase):
         self.assertIn("method1", exposed_methods)
         self.assertNotIn("method2", exposed_methods)
 
+    def test_fetch_does_not_trigger_properties(self):
+        """Test that get_exposed_methods only binds exposed attributes."""
+
+        class ExampleClass:
+            @property
+            def prop(self):
+                raise RuntimeError("property should not be accessed")
+
+            @staticmethod
+            @exposed_method()
+            def static_method(a: int) -> int:
+                return a
+
+            @exposed_method()
+            def method1(self):
+                pass
+
+        exposed_methods = get_exposed_methods(ExampleClass())
+
+        self.assertEqual(sorted(exposed_methods), ["method1", "static_method"])
+
+    def test_fetch_methods_exposed_later(self):
+        """Test that methods exposed after a first lookup are still found."""
+
+        class ExampleClass:
+            @exposed_method()
+            def method1(self):
+                pass
+
+        self.assertEqual(list(get_exposed_methods(ExampleClass)), ["method1"])
+
+        def method2(self):
+            pass
+
+        ExampleClass.method2 = exposed_method()(method2)
+
+        self.assertEqual(
+            sorted(get_exposed_methods(ExampleClass())), ["method1", "method2"]
+        )
+
+    def test_fetch_exposed_method_attached_later(self):
+        """Test that an already exposed function attached after a first lookup is found."""
+
+        @exposed_method()
+        def shared(self):
+            pass
+
+        class ExampleClass:
+            @exposed_method()
+            def method1(self):
+                pass
+
+        class SubClass(ExampleClass):
+            pass
+
+        self.assertEqual(list(get_exposed_methods(ExampleClass())), ["method1"])
+        self.assertEqual(list(get_exposed_methods(SubClass())), ["method1"])
+
+        ExampleClass.shared = shared
+
+        self.assertEqual(
+            list(get_exposed_methods(ExampleClass())), ["method1", "shared"]
+        )
+        self.assertEqual(list(get_exposed_methods(SubClass())), ["method1", "shared"])
+
+    def test_fetch_exposed_methods_in_slots(self):
+        """Test that exposed functions stored in slots are found."""
+
+        @exposed_method()
+        def slot_func():
+            pass
+
+        class ExampleClass:
+            __slots__ = ("func", "unset")
+
+            def __init__(self):
+                self.func = slot_func
+
+        self.assertEqual(list(get_exposed_methods(ExampleClass())), ["func"])
+
+    def test_fetch_exposed_methods_from_proxies(self):
+        """Test that exposed methods resolved through __getattr__ and listed by __dir__ are found."""
+
+        @exposed_method()
+        def proxied():
+            pass
+
+        class Proxy:
+            def __getattr__(self, name):
+                if name == "proxied":
+                    return proxied
+                raise AttributeError(name)
+
+            def __dir__(self):
+                return ["proxied"]
+
+        self.assertEqual(list(get_exposed_methods(Proxy())), ["proxied"])
+
+    def test_fetch_exposed_methods_from_descriptors(self):
+        """Test that exposed methods returned by custom descriptors are found."""
+
+        @exposed_method()
+        def described():
+            pass
+
+        class Descriptor:
+            def __get__(self, instance, owner=None):
+                return described
+
+        class ExampleClass:
+            method = Descriptor()
+
+        self.assertEqual(list(get_exposed_methods(ExampleClass())), ["method"])
+        self.assertEqual(list(get_exposed_methods(ExampleClass)), ["method"])
+
 
 class TestAssureExposedMethod(unittest.TestCase):
     """
@@ -1,6 +1,16 @@
 # Tests for the exposed_var module
 import unittest
 import asyncio
+from exposedfunctionality import (
+    ExposedValue,
+    add_exposed_value,
+    get_exposed_values,
+)
+from exposedfunctionality.variables import ExposedValueData
+
+
+def _exposed_values_dict(obj):
+    return {k: getattr(obj, k) for k in get_exposed_values(obj)}
 
 
 class TestExposedValue(unittest.TestCase):
@@ -9,8 +19,6 @@ class TestExposedValue(unittest.TestCase):
     def test_init_default_type(self):
         """Test the initialization with default type inference."""
 
-        from exposedfunctionality import ExposedValue
-
         ev = ExposedValue("name", 10)
         self.assertEqual(ev.name, "name")
         self.assertEqual(ev.default, 10)
@@ -19,8 +27,6 @@ class TestExposedValue(unittest.TestCase):
     def test_init_explicit_type(self):
         """Test the initialization with default type inference."""
 
-        from exposedfunctionality import ExposedValue
-
         ev = ExposedValue("name", 10, type_=float)
         self.assertEqual(ev.type, float)
 
@@ -34,7 +40,6 @@ class TestExposedValue(unittest.TestCase):
 
     def test_get(self):
         """Test getting the value using the descriptor."""
-        from exposedfunctionality import ExposedValue
 
         class TestClass:
             attr = ExposedValue("attr", 10)
@@ -46,7 +51,6 @@ class TestExposedValue(unittest.TestCase):
 
     def test_set(self):
         """Test getting the value using the descriptor."""
-        from exposedfunctionality import ExposedValue
 
         class TestClass:
             attr = ExposedValue("attr", 10)
@@ -60,8 +64,6 @@ class TestExposedValue(unittest.TestCase):
     def test_delete(self):
         """Test that deletion of the attribute is prevented."""
 
-        from exposedfunctionality import ExposedValue
-
         class TestClass:
             attr = ExposedValue("attr", 10)
 
@@ -72,13 +74,10 @@ class TestExposedValue(unittest.TestCase):
     def test_repr(self):
         """Test that deletion of the attribute is prevented."""
 
-        from exposedfunctionality import ExposedValue
-
         ev = ExposedValue("attr", 10)
         self.assertEqual(repr(ev), "ExposedValue(attr)")
 
     def test_valuechecker(self):
-        from exposedfunctionality import ExposedValue
 
         def valuechecker(value, valuedata):
             return value + 5
@@ -93,7 +92,6 @@ class TestExposedValue(unittest.TestCase):
         self.assertEqual(tc.attr, 10)
 
     def test_invalid_default(self):
-        from exposedfunctionality import ExposedValue
 
         with self.assertRaises(TypeError) as cm:
             ExposedValue("attr", "invalid", type_=int)
@@ -123,8 +121,6 @@ class TestExposedValueFunctions(unittest.TestCase):
     def test_add_exposed_value_instance(self):
         """Test dynamically adding an ExposedValue to an instance."""
 
-        from exposedfunctionality import add_exposed_value
-
         class TestClass:
             pass
 
@@ -146,7 +142,6 @@ class TestExposedValueFunctions(unittest.TestCase):
 
     def test_add_exposed_value_class(self):
         """Test dynamically adding an ExposedValue to a class."""
-        from exposedfunctionality import add_exposed_value
 
         class TestClass:
             pass
@@ -163,11 +158,6 @@ class TestExposedValueFunctions(unittest.TestCase):
 
     def test_get_exposed_values(self):
         # Test if adding an already existing attribute raises error
-        from exposedfunctionality import (
-            get_exposed_values,
-            add_exposed_value,
-            ExposedValue,
-        )
 
         class TestClass:
             attr = ExposedValue("attr", 10)
@@ -196,8 +186,6 @@ class TestExposedValueFunctions(unittest.TestCase):
     def test_disable_type_checking(self):
         """Test disabling type checking."""
 
-        from exposedfunctionality import ExposedValue
-
         class TestClass:
             a = ExposedValue("a", 10, type_=None)
 
@@ -209,12 +197,6 @@ class TestExposedValueFunctions(unittest.TestCase):
     def test_new_ins_from_inst_with_added_exposed(self):
         """Test creating a new instance from an instance with added ExposedValues."""
 
-        from exposedfunctionality import (
-            get_exposed_values,
-            add_exposed_value,
-            ExposedValue,
-        )
-
         class TestClass:
             attr = ExposedValue("attr", 10)
 
@@ -224,11 +206,8 @@ class TestExposedValueFunctions(unittest.TestCase):
         tc2 = tc.__class__()
         self.assertEqual(tc2.__class__.__name__, "_TestClass")
 
-        def get_exposed_values_dict(obj):
-            return {k: getattr(obj, k) for k, v in get_exposed_values(obj).items()}
-
         self.assertEqual(
-            get_exposed_values_dict(tc2),
+            _exposed_values_dict(tc2),
             {
                 "attr": 10,
                 "new_attr": 20,
@@ -253,19 +232,19 @@ class TestExposedValueFunctions(unittest.TestCase):
         self.assertEqual(tc3.__class__.__name__, "__TestClass")
         tc3.attr2 = 30
 
-        self.assertEqual(get_exposed_values_dict(tc), {"attr2": 10, "attr": 40})
-        self.assertEqual(get_exposed_values_dict(tc2), {"attr": 20})
+        self.assertEqual(_exposed_values_dict(tc), {"attr2": 10, "attr": 40})
+        self.assertEqual(_exposed_values_dict(tc2), {"attr": 20})
 
         # Exposed values are added to the class dict on first access
         with self.assertRaises(KeyError):
             self.assertEqual(tc3.__dict__["attr"], 10)
         self.assertEqual(
-            get_exposed_values_dict(tc3), {"attr": 10, "attr2": 30, "attr3": 20}
+            _exposed_values_dict(tc3), {"attr": 10, "attr2": 30, "attr3": 20}
         )
         self.assertEqual(tc3.attr, 10)
         self.assertEqual(tc3.__dict__["attr"], 10)
         self.assertEqual(
-            get_exposed_values_dict(tc3), {"attr": 10, "attr2": 30, "attr3": 20}
+            _exposed_values_dict(tc3), {"attr": 10, "attr2": 30, "attr3": 20}
         )
 
 
@@ -278,7 +257,6 @@ class TestExposedValueData(unittest.IsolatedAsyncioTestCase):
         """
         Test that the on_change_callback is correctly added and subsequently invoked when data changes.
         """
-        from exposedfunctionality.variables import ExposedValueData
 
         data = ExposedValueData()
         callback_triggered = False
@@ -296,7 +274,6 @@ class TestExposedValueData(unittest.IsolatedAsyncioTestCase):
         """
         Test adding an asynchronous on_change_callback and ensure it's invoked when data changes.
         """
-        from exposedfunctionality.variables import ExposedValueData
 
         data = ExposedValueData()
         callback_triggered_event = asyncio.Event()
@@ -317,7 +294,6 @@ class TestExposedValueData(unittest.IsolatedAsyncioTestCase):
         """
         Test that accessing attributes of ExposedValueData returns expected values.
         """
-        from exposedfunctionality.variables import ExposedValueData
 
         data = ExposedValueData(attr1="value1", attr2="value2")
 
@@ -335,7 +311,6 @@ class TestExposedValueData(unittest.IsolatedAsyncioTestCase):
         """
         Test that the on_change_callback receives the correct new and old values.
         """
-        from exposedfunctionality.variables import ExposedValueData
 
         data = ExposedValueData()
         received_values = []
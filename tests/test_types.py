@@ -11,6 +11,8 @@ from typing import Set, Literal
 from exposedfunctionality.function_parser.types import (
     _TYPE_GETTER,
     _STRING_GETTER,
+    _TYPE_ADDED_CALLBACKS,
+    cast_to_type,
 )
 from exposedfunctionality.function_parser import (
     string_to_type,
@@ -75,6 +77,14 @@ class TestStringToType(unittest.TestCase):
         # Asserting that the module was imported
         mock_import_module.assert_called_once_with("mock_module")
 
+    def test_resolved_module_path_is_not_reimported(self):
+        datetime_type = string_to_type("datetime.timedelta")
+        with patch(
+            "exposedfunctionality.function_parser.types.importlib.import_module"
+        ) as mock_import_module:
+            self.assertIs(string_to_type("datetime.timedelta"), datetime_type)
+        mock_import_module.assert_not_called()
+
     def test_typing_strings(self):
         # Test for typing types
 
@@ -93,6 +103,20 @@ class TestStringToType(unittest.TestCase):
         self.assertEqual(string_to_type("Set[float]"), Set[float])
         self.assertEqual(string_to_type("Literal[1,2,'hello']"), Literal[1, 2, "hello"])
 
+    def test_nested_typing_strings(self):
+        self.assertEqual(string_to_type("Dict[str, List[int]]"), Dict[str, List[int]])
+        self.assertEqual(
+            string_to_type("Tuple[Dict[str, int], Union[int, str]]"),
+            Tuple[Dict[str, int], Union[int, str]],
+        )
+
+    def test_optional_strings(self):
+        for _ in range(2):
+            self.assertEqual(string_to_type("int, optional"), Optional[int])
+        self.assertEqual(
+            type_to_string(string_to_type("int, optional")), "Union[int, None]"
+        )
+
     def test_wrongtypes(self):
         with self.assertRaises(TypeError):
             string_to_type(10)
@@ -113,6 +137,9 @@ class TestAddType(unittest.TestCase):
         _STRING_GETTER.clear()
         _TYPE_GETTER.update(self.initial_types)
         _STRING_GETTER.update(self.initial_string_types)
+        # the registries were edited directly, so clear the caches depending on them
+        for callback in _TYPE_ADDED_CALLBACKS:
+            callback()
 
     def test_add_new_type(self):
 
@@ -123,6 +150,20 @@ class TestAddType(unittest.TestCase):
         self.assertIn("NewType", _TYPE_GETTER)
         self.assertEqual(_TYPE_GETTER["NewType"], NewType)
 
+    def test_generic_strings_follow_the_registry(self):
+
+        class Foo:
+            pass
+
+        add_type(Foo, "Foo")
+        self.assertEqual(type_to_string(List[Foo]), "List[Foo]")
+
+        # rename the type and register the new name, which clears remembered strings
+        _STRING_GETTER[Foo] = "MyFoo"
+        add_type(Foo, "MyFoo")
+        self.assertEqual(type_to_string(Foo), "MyFoo")
+        self.assertEqual(type_to_string(List[Foo]), "List[MyFoo]")
+
     def test_adding_duplicate_type_does_not_override(self):
 
         class DuplicateType:
@@ -428,3 +469,17 @@ class TestTypeToString(unittest.TestCase):
 
         add_type(AliasType, "AliasType")
         self.assertEqual(string_to_type("AliasType"), AliasType)
+
+
+class TestCastToType(unittest.TestCase):
+    def test_exact_type_is_returned(self):
+        value = [1, 2]
+        self.assertIs(cast_to_type(value, list), value)
+        self.assertEqual(cast_to_type(True, int), 1)
+        self.assertIs(type(cast_to_type(True, int)), int)
+
+    def test_union_errors_are_chained(self):
+        with self.assertRaises(ValueError) as cm:
+            cast_to_type("x", Union[int, float])
+        self.assertIsNotNone(cm.exception.__cause__)
+        self.assertIsNotNone(cm.exception.__cause__.__cause__)